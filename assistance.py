@@ -6,7 +6,8 @@ UCD-CYBERFORCE — Journée d’Intégration (Assistant Terminal)
 Version remaniée selon le plan d'amélioration
 
 - Langue: Français uniquement (libellés + messages)
-- Dépendances: Standard library uniquement
+- Dépendances: Standard library uniquement (orjson utilisé s’il est installé)
+- Python 3.10+ (dataclasses avec slots)
 - Fonctionnalités:
   • Saisie guidée avec validations et indices clairs
   • Détection de doublons par CNE/CNI (remplacer / fusionner / annuler)
@@ -26,13 +27,22 @@ Conseil: utilisez un terminal à largeur >= 100 colonnes pour un rendu optimal.
 import re
 import csv
 import json
+import math
 import os
-from dataclasses import dataclass, asdict
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-@dataclass
+try:
+    import orjson  # optionnel : sérialisation JSON plus rapide
+except ImportError:
+    orjson = None
+
+@dataclass(slots=True)
 class Participant:
     nom_complet: str      # 3–80, contient espace
     telephone: str        # ^0[5-7]\d{8}$
@@ -43,7 +53,7 @@ class Participant:
     montant_mad: float    # >= 0
     notes: str = ""       # optionnel
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     montant_defaut: float = 20.0
     exiger_tout: bool = True
@@ -61,50 +71,170 @@ class Stats:
     impayes: int
     total_mad: float
 
-Participants = List[Participant]
-Index = Dict[str, int]  # map CNE/CNI -> index
+Participants = Iterable[Participant]
+_FIELDS = tuple(f.name for f in fields(Participant))
+# champs obligatoires d’une ligne d’autosauvegarde, `notes` (optionnel) exclu
+_REQUIRED = _FIELDS[:-1]
+assert _FIELDS[-1] == "notes", "notes doit rester le dernier champ de Participant"
+
+def p_to_dict(p: Participant) -> Dict[str, object]:
+    """Dict plat d’un participant, sans la copie profonde d’asdict()."""
+    return {k: getattr(p, k) for k in _FIELDS}
+
+_CONFIG_FIELDS = tuple(f.name for f in fields(Config))
+
+def cfg_to_dict(cfg: Config) -> Dict[str, object]:
+    """Dict plat de la configuration, pendant de p_to_dict()."""
+    return {k: getattr(cfg, k) for k in _CONFIG_FIELDS}
+
+Index = Dict[str, Set[int]]  # map CNE/CNI -> identifiants qui la portent
+Entrees = List[Tuple[int, Participant]]  # (identifiant, participant)
+
+class Registre(Mapping[int, Participant]):
+    """Participants indexés par un identifiant stable (identifiant -> participant).
+
+    Les identifiants ne sont jamais renumérotés : ajout, remplacement et
+    suppression sont en O(1) et les index CNE/CNI restent valides.
+    L’ordre d’itération est l’ordre d’insertion ; `participants()` parcourt
+    les valeurs.
+    """
+
+    def __init__(self, participants: Iterable[Participant] = ()) -> None:
+        self._next_id = 0
+        self._by_id: Dict[int, Participant] = {}
+        self._cne: Index = {}
+        self._cni: Index = {}
+        # noms en minuscules, calculés une fois par écriture pour la recherche
+        self._nom_lc: Dict[int, str] = {}
+        for p in participants:
+            self.ajouter(p)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._by_id)
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self._by_id
+
+    def __getitem__(self, pid: int) -> Participant:
+        return self._by_id[pid]
+
+    def participants(self) -> Iterator[Participant]:
+        return iter(self._by_id.values())
+
+    def vue_recherche(self) -> Iterator[Tuple[int, Participant, str]]:
+        """(identifiant, participant, nom en minuscules) dans l’ordre d’insertion."""
+        nom_lc = self._nom_lc
+        return ((pid, p, nom_lc[pid]) for pid, p in self._by_id.items())
+
+    def entrees(self) -> Entrees:
+        return list(self._by_id.items())
+
+    def doublon(self, p: Participant) -> Optional[int]:
+        # une clé peut être partagée (ex. après une modification) :
+        # on renvoie le porteur le plus récent
+        if p.CNE and p.CNE.upper() in self._cne:
+            return max(self._cne[p.CNE.upper()])
+        if p.CNI and p.CNI.upper() in self._cni:
+            return max(self._cni[p.CNI.upper()])
+        return None
+
+    def ajouter(self, p: Participant) -> int:
+        pid = self._next_id
+        self._next_id += 1
+        self._by_id[pid] = p
+        self._indexer(pid, p)
+        self._nom_lc[pid] = p.nom_complet.lower()
+        return pid
+
+    def remplacer(self, pid: int, p: Participant) -> None:
+        self._desindexer(pid, self._by_id[pid])
+        self._by_id[pid] = p
+        self._indexer(pid, p)
+        self._nom_lc[pid] = p.nom_complet.lower()
+
+    def supprimer(self, pid: int) -> Participant:
+        p = self._by_id.pop(pid)
+        del self._nom_lc[pid]
+        self._desindexer(pid, p)
+        return p
+
+    def _indexer(self, pid: int, p: Participant) -> None:
+        if p.CNE:
+            self._cne.setdefault(p.CNE.upper(), set()).add(pid)
+        if p.CNI:
+            self._cni.setdefault(p.CNI.upper(), set()).add(pid)
+
+    def _desindexer(self, pid: int, p: Participant) -> None:
+        # la clé ne disparaît que lorsque plus aucun enregistrement ne la porte
+        for idx, cle in ((self._cne, p.CNE), (self._cni, p.CNI)):
+            if not cle:
+                continue
+            ids = idx.get(cle.upper())
+            if ids is not None:
+                ids.discard(pid)
+                if not ids:
+                    del idx[cle.upper()]
 
 # ==========================
 # === Couleurs & UI helpers
 # ==========================
 
+@lru_cache(maxsize=1)
 def ansi_supported() -> bool:
     return os.getenv("TERM") not in (None, "", "dumb")
 
-A_BOLD = "\x1b[1m" if ansi_supported() else ""
-A_DIM = "\x1b[2m" if ansi_supported() else ""
-C_RED = "\x1b[31m" if ansi_supported() else ""
-C_GRN = "\x1b[32m" if ansi_supported() else ""
-C_YEL = "\x1b[33m" if ansi_supported() else ""
-C_CYN = "\x1b[36m" if ansi_supported() else ""
-C_RST = "\x1b[0m" if ansi_supported() else ""
+_ANSI = ansi_supported()
+
+A_BOLD = "\x1b[1m" if _ANSI else ""
+A_DIM = "\x1b[2m" if _ANSI else ""
+C_RED = "\x1b[31m" if _ANSI else ""
+C_GRN = "\x1b[32m" if _ANSI else ""
+C_YEL = "\x1b[33m" if _ANSI else ""
+C_CYN = "\x1b[36m" if _ANSI else ""
+C_RST = "\x1b[0m" if _ANSI else ""
 
 APP_TITLE = f"{A_BOLD}UCD-CYBERFORCE — Journée d’Intégration{C_RST}"
 
 def clear_screen() -> None:
-    os.system("clear" if os.name != "nt" else "cls")
+    if _ANSI:
+        # séquence ANSI directe : évite de lancer un shell à chaque affichage
+        sys.stdout.write("\x1b[2J\x1b[3J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system("clear" if os.name != "nt" else "cls")
 
 def hr(char: str = "─", width: int = 96) -> str:
     return char * width
 
-def box(title: str, lines: List[str], footer: Optional[str] = None, width: int = 96) -> None:
-    """Boîte avec en-tête coloré et contenu multi-lignes."""
+def ecrire(lines: List[str]) -> None:
+    """Écrit un écran entier en un seul appel (un write au lieu d’un par ligne)."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def box_lines(title: str, lines: List[str], footer: Optional[str] = None, width: int = 96) -> List[str]:
+    """Lignes d’une boîte avec en-tête coloré et contenu multi-lignes."""
     t = f" {title} "
     top_inner = t.ljust(width - 2, "─")
-    top = "┌" + f"{C_CYN}{A_BOLD}{top_inner}{C_RST}" + "┐"
-    bot = "└" + ("─" * (width - 2)) + "┘"
-    print(top)
-    for line in lines:
-        print("│ " + line.ljust(width - 3) + "│")
+    out = ["┌" + f"{C_CYN}{A_BOLD}{top_inner}{C_RST}" + "┐"]
+    out += ["│ " + line.ljust(width - 3) + "│" for line in lines]
     if footer:
-        print("│ " + footer.ljust(width - 3) + "│")
-    print(bot)
+        out.append("│ " + footer.ljust(width - 3) + "│")
+    out.append("└" + ("─" * (width - 2)) + "┘")
+    return out
+
+def box(title: str, lines: List[str], footer: Optional[str] = None, width: int = 96) -> None:
+    """Boîte avec en-tête coloré et contenu multi-lignes."""
+    ecrire(box_lines(title, lines, footer, width))
+
+def section_lines(title: str) -> List[str]:
+    return ["", f"{C_CYN}{A_BOLD}── {title}{C_RST}", ""]
 
 def section(title: str) -> None:
     """En-tête de section simple, en cyan."""
-    print()
-    print(f"{C_CYN}{A_BOLD}── {title}{C_RST}")
-    print()
+    ecrire(section_lines(title))
 
 def pause(msg: str = "Appuyez sur Entrée pour continuer...") -> None:
     try:
@@ -206,31 +336,38 @@ S = {
 # === Saisie & Validations
 # ==========================
 
-RX_TEL = re.compile(r"^0[5-7]\d{8}$")
-RX_CNE = re.compile(r"^[A-Za-z0-9]{8,12}$")
-RX_CNI = re.compile(r"^[A-Za-z0-9]{6,12}$")
+# motifs utilisés avec fullmatch() : pas besoin d’ancres ^...$
+RX_TEL = re.compile(r"0[5-7]\d{8}")
+RX_CNE = re.compile(r"[A-Za-z0-9]{8,12}")
+RX_CNI = re.compile(r"[A-Za-z0-9]{6,12}")
+
+_OUI = frozenset({"o", "oui", "y", "yes"})
+_STATUT_PAYE = frozenset({"p", "payé", "payee", "paye", "oui", "o", "y", "yes"})
+_STATUT_IMPAYE = frozenset({"i", "impayé", "impaye", "non", "n", "no"})
 
 def ok_nom(n: str) -> bool:
     n = (n or "").strip()
     return 3 <= len(n) <= 80 and " " in n
 
 def ok_tel(t: str) -> bool:
-    return bool(RX_TEL.match((t or "").strip()))
+    return RX_TEL.fullmatch(t or "") is not None
 
 def ok_age(a: int) -> bool:
     return 17 <= a <= 30
 
 def ok_cne(c: str) -> bool:
-    return bool(RX_CNE.match((c or "").strip()))
+    return RX_CNE.fullmatch(c or "") is not None
 
 def ok_cni(c: str) -> bool:
-    return bool(RX_CNI.match((c or "").strip()))
+    return RX_CNI.fullmatch(c or "") is not None
 
 def ok_montant(v: float) -> bool:
+    # inf/nan refusés : orjson les écrirait en null dans l’autosauvegarde
     try:
-        return float(v) >= 0.0
+        x = float(v)
     except Exception:
         return False
+    return math.isfinite(x) and x >= 0.0
 
 def normaliser_statut(s: str) -> str:
     s = (s or "").strip().lower()
@@ -242,15 +379,15 @@ def parse_oui_non(defaut_oui: bool = True, reponse: str = "") -> bool:
     r = (reponse or "").strip().lower()
     if not r:
         return defaut_oui
-    return r in ("o", "oui", "y", "yes")
+    return r in _OUI
 
 def parse_statut_input(raw: str, default_statut: str) -> str:
-    if not raw.strip():
-        return normaliser_statut(default_statut)
     r = raw.strip().lower()
-    if r in ("p", "payé", "payee", "paye", "oui", "o", "y", "yes"):
+    if not r:
+        return normaliser_statut(default_statut)
+    if r in _STATUT_PAYE:
         return "Payé"
-    if r in ("i", "impayé", "impaye", "non", "n", "no"):
+    if r in _STATUT_IMPAYE:
         return "Impayé"
     notify_warn("Entrée non reconnue, utilisation du statut par défaut.")
     return normaliser_statut(default_statut)
@@ -269,7 +406,7 @@ def saisir_participant(cfg: Config, existant: Optional[Participant] = None) -> P
             notes="",
         )
     else:
-        p = Participant(**asdict(existant))
+        p = replace(existant)
 
     section("Saisie du participant")
 
@@ -400,7 +537,7 @@ def saisir_participant(cfg: Config, existant: Optional[Participant] = None) -> P
 def save_config(cfg: Config) -> None:
     try:
         with open(cfg.config_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(cfg), f, ensure_ascii=False, indent=2)
+            json.dump(cfg_to_dict(cfg), f, ensure_ascii=False, indent=2)
     except Exception:
         pass
 
@@ -419,29 +556,47 @@ def load_config() -> Config:
     cfg.statut_defaut = normaliser_statut(cfg.statut_defaut)
     return cfg
 
-def autosave(cfg: Config, rows: Participants) -> None:
+def autosave(cfg: Config, rows: Registre) -> None:
     if not cfg.autosave:
         return
+    tmp_path = cfg.autosave_path + ".tmp"
+    data = [p_to_dict(p) for p in rows.participants()]
     try:
-        with open(cfg.autosave_path, "w", encoding="utf-8") as f:
-            json.dump([asdict(p) for p in rows], f, ensure_ascii=False)
+        # écriture dans un fichier temporaire puis renommage atomique :
+        # une interruption ne corrompt jamais l’autosauvegarde précédente
+        if orjson is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, cfg.autosave_path)
     except Exception:
         pass
 
-def load_autosave(cfg: Config) -> Participants:
+def load_autosave(cfg: Config) -> Registre:
     if not os.path.exists(cfg.autosave_path):
-        return []
+        return Registre()
     try:
-        with open(cfg.autosave_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        rows = [Participant(**d) for d in data]
+        if orjson is not None:
+            with open(cfg.autosave_path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(cfg.autosave_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        # construction positionnelle : évite le dépaquetage **kwargs par ligne ;
+        # seul `notes` est optionnel, une autre clé absente rejette le fichier
+        rows = Registre(
+            Participant(*[d[k] for k in _REQUIRED], d.get("notes", ""))
+            for d in data
+        )
         if rows:
             notify_ok(S["reprendre"])
         return rows
     except Exception:
-        return []
+        return Registre()
 
-def exporter_tout(cfg: Config, rows: Participants) -> Tuple[str, str, Optional[str]]:
+def exporter_tout(cfg: Config, rows: Registre) -> Tuple[str, str, Optional[str]]:
     """Exporte toujours CSV + TXT, JSON seulement si cfg.export_json == True."""
     out_dir = Path(cfg.dossier_export)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -450,15 +605,21 @@ def exporter_tout(cfg: Config, rows: Participants) -> Tuple[str, str, Optional[s
     txt_path = out_dir / "participants_integration.txt"
     json_path = out_dir / "participants_integration.json"
 
-    # CSV
-    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+    # Un seul passage sur les participants : lignes CSV écrites au fil de
+    # l’eau, lignes TXT, compteurs et dicts JSON accumulés en mémoire.
+    txt_body: List[str] = []
+    json_rows: List[Dict[str, object]] = []
+    payes = 0
+    total_mad = 0.0
+    with open(csv_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(
             ["nom_complet", "telephone", "age", "CNE", "CNI", "montant_mad", "statut_frais", "notes"]
         )
-        for p in rows:
+        # `#` = identifiants de la session, ceux acceptés par T / R / L
+        for i, p in rows.entrees():
             w.writerow(
-                [
+                (
                     p.nom_complet,
                     p.telephone,
                     p.age,
@@ -467,28 +628,37 @@ def exporter_tout(cfg: Config, rows: Participants) -> Tuple[str, str, Optional[s
                     f"{p.montant_mad:.0f}",
                     p.statut_frais,
                     p.notes,
-                ]
+                )
             )
+            txt_body.append(table_row(i, p))
+            if p.statut_frais == "Payé":
+                payes += 1
+                total_mad += p.montant_mad
+            if cfg.export_json:
+                json_rows.append(p_to_dict(p))
 
     # TXT (table + stats)
-    lines_out: List[str] = []
-    lines_out.append(APP_TITLE)
-    lines_out.append(hr())
-    lines_out += render_table(rows, page=0, page_size=max(1, len(rows)))
-    st = stats(rows)
-    lines_out.append("")
-    lines_out.append(
-        f"Résumé — Participants: {st.total}  Payés: {st.payes}  "
-        f"Impayés: {st.impayes}  Total MAD: {st.total_mad:.0f}"
-    )
+    total = len(txt_body)
+    lines_out = [
+        APP_TITLE,
+        hr(),
+        *table_frame(txt_body, 0, 1, total),
+        "",
+        f"Résumé — Participants: {total}  Payés: {payes}  "
+        f"Impayés: {total - payes}  Total MAD: {total_mad:.0f}",
+    ]
     with open(txt_path, "w", encoding="utf-8") as f:
         f.write("\n".join(lines_out) + "\n")
 
     json_result: Optional[str] = None
     if cfg.export_json:
         try:
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump([asdict(p) for p in rows], f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(json_path, "wb") as f:
+                    f.write(orjson.dumps(json_rows, option=orjson.OPT_INDENT_2))
+            else:
+                with open(json_path, "w", encoding="utf-8") as f:
+                    json.dump(json_rows, f, ensure_ascii=False, indent=2)
             json_result = str(json_path)
         except Exception:
             json_result = None
@@ -496,28 +666,11 @@ def exporter_tout(cfg: Config, rows: Participants) -> Tuple[str, str, Optional[s
     return str(csv_path), str(txt_path), json_result
 
 # ==========================
-# === Index, stats & table
+# === Stats & table
 # ==========================
 
-def indexer(rows: Participants) -> Tuple[Index, Index]:
-    by_cne: Index = {}
-    by_cni: Index = {}
-    for i, p in enumerate(rows):
-        if p.CNE:
-            by_cne[p.CNE.upper()] = i
-        if p.CNI:
-            by_cni[p.CNI.upper()] = i
-    return by_cne, by_cni
-
-def doublon(p: Participant, idx_cne: Index, idx_cni: Index) -> Optional[int]:
-    if p.CNE and p.CNE.upper() in idx_cne:
-        return idx_cne[p.CNE.upper()]
-    if p.CNI and p.CNI.upper() in idx_cni:
-        return idx_cni[p.CNI.upper()]
-    return None
-
 def fusionner(old: Participant, new: Participant) -> Participant:
-    merged = Participant(**asdict(new))
+    merged = replace(new)
     if old.notes.strip() and new.notes.strip() and old.notes.strip() != new.notes.strip():
         merged.notes = f"{old.notes} | {new.notes}"
     elif not new.notes.strip():
@@ -525,11 +678,15 @@ def fusionner(old: Participant, new: Participant) -> Participant:
     return merged
 
 def stats(rows: Participants) -> Stats:
-    total = len(rows)
-    payes = sum(1 for p in rows if p.statut_frais == "Payé")
-    impayes = total - payes
-    total_mad = sum(p.montant_mad for p in rows if p.statut_frais == "Payé")
-    return Stats(total=total, payes=payes, impayes=impayes, total_mad=total_mad)
+    total = 0
+    payes = 0
+    total_mad = 0.0
+    for p in rows:
+        total += 1
+        if p.statut_frais == "Payé":
+            payes += 1
+            total_mad += p.montant_mad
+    return Stats(total=total, payes=payes, impayes=total - payes, total_mad=total_mad)
 
 HEADERS = {
     "index": "#",
@@ -558,40 +715,52 @@ def fmt_cell(v, w: int) -> str:
     s = str(v)
     return s if len(s) <= w else s[: max(0, w - 1)] + "…"
 
-def render_table(rows: Participants, page: int = 0, page_size: int = 12) -> List[str]:
+# gabarit de ligne : "{:<w.w}" complète et tronque chaque cellule en un appel
+_ROW_FMT = " │ ".join(f"{{:<{w}.{w}}}" for _, w in COLS)
+_W_NOM = dict(COLS)["nom"]
+_W_MONTANT = dict(COLS)["montant"]
+_W_NOTES = dict(COLS)["notes"]
+_HEADER = f"{HEADERS['index']:>3} " + _ROW_FMT.format(*(HEADERS[k] for k, _ in COLS))
+_SEP = "─" * len(_HEADER)
+
+def table_row(i: int, p: Participant) -> str:
+    # champs pouvant dépasser leur colonne (nom, montant, notes) : ellipse
+    # explicite, pour qu’une valeur tronquée ne passe pas pour une autre
+    return f"{A_DIM}{i:>3}{C_RST} " + _ROW_FMT.format(
+        fmt_cell(p.nom_complet, _W_NOM),
+        p.telephone,
+        str(p.age),
+        p.CNE,
+        p.CNI,
+        fmt_cell(f"{p.montant_mad:.0f}", _W_MONTANT),
+        p.statut_frais,
+        fmt_cell(p.notes, _W_NOTES),
+    )
+
+def table_frame(body: List[str], page: int, total_pages: int, total: int) -> List[str]:
+    """En-tête, lignes déjà formatées et pied de table."""
+    footer = f"Page {page+1}/{total_pages} — Total: {total}"
+    return [f"{C_CYN}{A_BOLD}{_HEADER}{C_RST}", _SEP, *body, _SEP, footer]
+
+def render_table(rows: Entrees, page: int = 0, page_size: int = 12) -> List[str]:
     start = page * page_size
     chunk = rows[start : start + page_size]
-    header = " │ ".join(fmt_cell(HEADERS[k], w) for k, w in COLS)
-    sep = "─" * len(header)
-    body: List[str] = []
-    for i, p in enumerate(chunk, start=start):
-        data = [
-            (p.nom_complet, 24),
-            (p.telephone, 12),
-            (p.age, 3),
-            (p.CNE, 12),
-            (p.CNI, 12),
-            (f"{p.montant_mad:.0f}", 8),
-            (p.statut_frais, 7),
-            (p.notes, 28),
-        ]
-        row = f"{A_DIM}{str(i).rjust(3)}{C_RST} " + " │ ".join(
-            fmt_cell(v, w) for v, w in data
-        )
-        body.append(row)
+    body = [table_row(i, p) for i, p in chunk]
     total_pages = max(1, (len(rows) - 1) // page_size + 1)
-    footer = f"Page {page+1}/{total_pages} — Total: {len(rows)}"
-    return [f"{C_CYN}{A_BOLD}{header}{C_RST}", sep, *body, sep, footer]
+    return table_frame(body, page, total_pages, len(rows))
 
-def print_stats(rows: Participants) -> None:
+def stats_lines(rows: Participants) -> List[str]:
     st = stats(rows)
-    print()
-    print(
+    return [
+        "",
         f"{A_BOLD}Statistiques — Participants: {st.total}  Payés: {st.payes}  "
-        f"Impayés: {st.impayes}  Total MAD: {st.total_mad:.0f}{C_RST}"
-    )
+        f"Impayés: {st.impayes}  Total MAD: {st.total_mad:.0f}{C_RST}",
+    ]
+
+def print_stats(rows: Participants) -> None:
+    ecrire(stats_lines(rows))
 
-def lister_pagine(rows: Participants, titre: str = "Table des participants") -> None:
+def lister_pagine(rows: Entrees, titre: str = "Table des participants") -> None:
     if not rows:
         notify_warn("Aucune donnée à afficher.")
         pause()
@@ -599,16 +768,19 @@ def lister_pagine(rows: Participants, titre: str = "Table des participants") ->
     page = 0
     page_size = 12
     total_pages = max(1, (len(rows) - 1) // page_size + 1)
+    lignes_stats = stats_lines(p for _, p in rows)  # rows ne change pas ici
     while True:
         clear_screen()
-        section(titre)
         table_lines = render_table(rows, page=page, page_size=page_size)
-        box(
-            titre,
-            table_lines,
-            footer="N = Page suivante | P = Page précédente | Q = Retour menu",
+        ecrire(
+            section_lines(titre)
+            + box_lines(
+                titre,
+                table_lines,
+                footer="N = Page suivante | P = Page précédente | Q = Retour menu",
+            )
+            + lignes_stats
         )
-        print_stats(rows)
         k = input("\nVotre choix (N/P/Q) : ").strip().lower()
         if k == "p":
             page = max(0, page - 1)
@@ -621,28 +793,29 @@ def lister_pagine(rows: Participants, titre: str = "Table des participants") ->
 # === Recherche & actions
 # ==========================
 
-def recherche(rows: Participants, q: str) -> List[int]:
+def recherche(rows: Registre, q: str) -> List[int]:
     q = (q or "").strip().lower()
     if not q:
         return []
-    hits: List[int] = []
-    for i, p in enumerate(rows):
-        if (q in p.nom_complet.lower()) or (q in p.telephone) or (q == p.CNE.lower()) or (q == p.CNI.lower()):
-            hits.append(i)
-    return hits
-
-def modifier_dialogue(rows: Participants, idx: int, cfg: Config) -> None:
-    if not (0 <= idx < len(rows)):
+    q_up = q.upper()  # CNE/CNI sont stockés en majuscules
+    return [
+        i
+        for i, p, nom_lc in rows.vue_recherche()
+        if q_up == p.CNE or q_up == p.CNI or q in p.telephone or q in nom_lc
+    ]
+
+def modifier_dialogue(rows: Registre, idx: int, cfg: Config) -> None:
+    if idx not in rows:
         notify_err(S["erreurs"]["introuvable"])
         return
     section(f"Modification de l’index {idx}")
     nouveau = saisir_participant(cfg, existant=rows[idx])
-    rows[idx] = nouveau
+    rows.remplacer(idx, nouveau)
     autosave(cfg, rows)
     notify_ok(S["maj"])
 
-def basculer_paye(rows: Participants, idx: int, cfg: Config) -> None:
-    if not (0 <= idx < len(rows)):
+def basculer_paye(rows: Registre, idx: int, cfg: Config) -> None:
+    if idx not in rows:
         notify_err(S["erreurs"]["introuvable"])
         return
     p = rows[idx]
@@ -655,27 +828,26 @@ def basculer_paye(rows: Participants, idx: int, cfg: Config) -> None:
     autosave(cfg, rows)
     notify_ok(S["maj"])
 
-def ajouter_participant(cfg: Config, rows: Participants) -> None:
+def ajouter_participant(cfg: Config, rows: Registre) -> None:
     nouveau = saisir_participant(cfg)
-    idx_cne, idx_cni = indexer(rows)
-    di = doublon(nouveau, idx_cne, idx_cni)
+    di = rows.doublon(nouveau)
     if di is not None:
         rep = input(f"{C_YEL}{S['dedup']}{C_RST} ").strip().lower()
         if rep.startswith("r"):  # Remplacer
-            rows[di] = nouveau
+            rows.remplacer(di, nouveau)
             notify_ok(S["maj"])
         elif rep.startswith("f"):  # Fusionner
-            rows[di] = fusionner(rows[di], nouveau)
+            rows.remplacer(di, fusionner(rows[di], nouveau))
             notify_ok(S["maj"])
         else:
             notify_warn("Ajout annulé.")
             return
     else:
-        rows.append(nouveau)
+        rows.ajouter(nouveau)
         notify_ok(S["sauve"])
     autosave(cfg, rows)
 
-def recherche_workflow(cfg: Config, rows: Participants) -> None:
+def recherche_workflow(cfg: Config, rows: Registre) -> None:
     clear_screen()
     section("Recherche / modification / suppression")
     q = input("Rechercher (nom, téléphone, CNE ou CNI) : ").strip()
@@ -686,7 +858,7 @@ def recherche_workflow(cfg: Config, rows: Participants) -> None:
         return
 
     print(f"\nRésultats (index globaux): {ids}")
-    subset = [rows[i] for i in ids]
+    subset = [(i, rows[i]) for i in ids]
     lister_pagine(subset, titre="Résultats de la recherche")
 
     print()
@@ -701,7 +873,7 @@ def recherche_workflow(cfg: Config, rows: Participants) -> None:
         pause()
         return
 
-    if not (0 <= idx < len(rows)):
+    if idx not in rows:
         notify_err(S["erreurs"]["introuvable"])
         pause()
         return
@@ -710,7 +882,7 @@ def recherche_workflow(cfg: Config, rows: Participants) -> None:
         modifier_dialogue(rows, idx, cfg)
     elif action.startswith("s"):
         if input(f"{S['confirm']['supprimer']} ").strip().lower().startswith("o"):
-            rows.pop(idx)
+            rows.supprimer(idx)
             autosave(cfg, rows)
             notify_ok(S["supprime"])
         else:
@@ -723,18 +895,19 @@ def recherche_workflow(cfg: Config, rows: Participants) -> None:
 # === Menu & Logique principale
 # ==========================
 
-def afficher_menu() -> None:
-    section("Menu principal")
-    print("E  Enregistrer un nouveau participant")
-    print("L  Lister les participants")
-    print()
-    print("R  Rechercher / modifier / supprimer")
-    print("T  Basculer Payé/Impayé par index")
-    print()
-    print("X  Exporter (CSV + TXT)")
-    print("Q  Quitter")
-    print()
-    print(f"{A_DIM}Astuce : tapez 'h' pour l’aide rapide.{C_RST}")
+def menu_lines() -> List[str]:
+    return section_lines("Menu principal") + [
+        "E  Enregistrer un nouveau participant",
+        "L  Lister les participants",
+        "",
+        "R  Rechercher / modifier / supprimer",
+        "T  Basculer Payé/Impayé par index",
+        "",
+        "X  Exporter (CSV + TXT)",
+        "Q  Quitter",
+        "",
+        f"{A_DIM}Astuce : tapez 'h' pour l’aide rapide.{C_RST}",
+    ]
 
 def show_help() -> None:
     clear_screen()
@@ -744,10 +917,8 @@ def show_help() -> None:
 def config_simple(cfg: Config) -> Config:
     section("Mode simple — Configuration minimale")
     m = prompt(S["setup"]["montant_defaut"], str(cfg.montant_defaut))
-    try:
+    if ok_montant(m):
         cfg.montant_defaut = float(m)
-    except Exception:
-        pass
     # le reste = valeurs recommandées
     cfg.exiger_tout = True
     cfg.autosave = True
@@ -767,10 +938,8 @@ def config_avancee(cfg: Config) -> Config:
     print()
 
     m = prompt(S["setup"]["montant_defaut"], str(cfg.montant_defaut))
-    try:
+    if ok_montant(m):
         cfg.montant_defaut = float(m)
-    except Exception:
-        pass
 
     d = prompt(S["setup"]["dossier_export"], cfg.dossier_export)
     if d.strip():
@@ -802,7 +971,7 @@ def etape_demarrage(cfg: Config) -> Config:
         ],
     )
     rep = input("Utiliser la configuration recommandée ? (O/n) ").strip().lower()
-    if rep in ("", "o", "oui", "y", "yes"):
+    if not rep or rep in _OUI:
         # Configuration recommandée
         cfg.montant_defaut = 20.0
         cfg.exiger_tout = True
@@ -839,7 +1008,7 @@ def etape_demarrage(cfg: Config) -> Config:
 def assistant() -> None:
     clear_screen()
     cfg = load_config()
-    rows: Participants = load_autosave(cfg)
+    rows = load_autosave(cfg)
 
     # 1) écran d’accueil + configuration recommandée / simple / avancée
     cfg = etape_demarrage(cfg)
@@ -847,11 +1016,7 @@ def assistant() -> None:
     # 2) boucle principale (menu simplifié)
     while True:
         clear_screen()
-        print(APP_TITLE)
-        print(S["entete"])
-        print()
-        afficher_menu()
-        print_stats(rows)
+        ecrire([APP_TITLE, S["entete"], "", *menu_lines(), *stats_lines(rows.participants())])
         choix = input("\nVotre choix : ").strip().lower()
 
         if choix == "h":
@@ -863,7 +1028,7 @@ def assistant() -> None:
             pause()
 
         elif choix == "l":
-            lister_pagine(rows)
+            lister_pagine(rows.entrees())
 
         elif choix == "r":
             recherche_workflow(cfg, rows)
@@ -911,7 +1076,7 @@ def assistant() -> None:
                     if jsp:
                         print(f"  - {os.path.basename(jsp)} (JSON)")
                     print(f"\nDossier : {os.path.dirname(csvp) or '.'}")
-                    print_stats(rows)
+                    print_stats(rows.participants())
                     pause("Appuyez sur Entrée pour quitter...")
             print("\nMerci. À bientôt !")
             break
@@ -0,0 +1,2 @@
+# conftest.py à la racine : pytest ajoute ce dossier à sys.path,
+# ce qui rend `assistance` importable depuis tests/.
@@ -0,0 +1,148 @@
+import csv
+import json
+import re
+
+from assistance import (
+    Config,
+    Participant,
+    Registre,
+    autosave,
+    exporter_tout,
+    load_autosave,
+    ok_cne,
+    ok_cni,
+    ok_montant,
+    ok_tel,
+    recherche,
+    table_row,
+)
+
+
+def _p(nom: str, cne: str, cni: str) -> Participant:
+    return Participant(nom, "0600000000", 20, cne, cni, "Payé", 20.0)
+
+
+def test_doublon_apres_modification_puis_suppression():
+    reg = Registre([_p("Ali Ben", "CNE00001", "CNI001"), _p("Sara Kh", "CNE00002", "CNI002")])
+    # l’enregistrement 1 est modifié pour partager le CNE de l’enregistrement 0
+    reg.remplacer(1, _p("Sara Kh", "CNE00001", "CNI002"))
+    reg.supprimer(1)
+    assert reg.doublon(_p("X Y", "CNE00001", "")) == 0
+    assert reg.doublon(_p("X Y", "", "CNI002")) is None
+
+
+def test_load_autosave_rejette_un_enregistrement_incomplet(tmp_path):
+    chemin = tmp_path / "autosave.json"
+    cfg = Config(autosave_path=str(chemin))
+    chemin.write_text(
+        '[{"nom_complet": "Ali Ben", "telephone": "0600000000", "age": 20,'
+        ' "CNE": "CNE00001", "CNI": "CNI001", "statut_frais": "Payé"}]',
+        encoding="utf-8",
+    )
+    assert len(load_autosave(cfg)) == 0
+
+    chemin.write_text(
+        '[{"nom_complet": "Ali Ben", "telephone": "0600000000", "age": 20,'
+        ' "CNE": "CNE00001", "CNI": "CNI001", "statut_frais": "Payé",'
+        ' "montant_mad": 20.0}]',
+        encoding="utf-8",
+    )
+    rows = load_autosave(cfg)
+    assert len(rows) == 1 and rows[0].notes == ""
+
+
+def test_table_row_marque_un_montant_tronque():
+    p = Participant("Ali Ben", "0600000000", 20, "CNE00001", "CNI001", "Payé", 123456789.0)
+    assert "1234567…" in table_row(0, p)
+    assert "12345678 " not in table_row(0, p)
+
+
+def test_registre_mapping_par_identifiant():
+    reg = Registre([_p("Ali Ben", "CNE00001", "CNI001"), _p("Sara Kh", "CNE00002", "CNI002")])
+    reg.supprimer(0)
+    assert list(reg) == [1]
+    assert 1 in reg and 0 not in reg
+    assert [p.nom_complet for p in reg.participants()] == ["Sara Kh"]
+
+
+def test_recherche_suit_les_modifications():
+    reg = Registre([_p("Ali Ben", "CNE00001", "CNI001"), _p("Sara Kh", "CNE00002", "CNI002")])
+    assert recherche(reg, "ALI") == [0]
+    reg.remplacer(0, _p("Omar Ben", "CNE00001", "CNI001"))
+    assert recherche(reg, "ali") == []
+    assert recherche(reg, "ben") == [0]
+    reg.supprimer(0)
+    assert recherche(reg, "cne00002") == [1]
+
+
+def test_ok_montant_refuse_les_valeurs_non_finies():
+    assert ok_montant(0) and ok_montant("20")
+    assert not ok_montant(-1)
+    assert not ok_montant(float("inf"))
+    assert not ok_montant("1e999")
+    assert not ok_montant(float("nan"))
+
+
+def test_autosave_aller_retour(tmp_path):
+    cfg = Config(autosave_path=str(tmp_path / "autosave.json"))
+    reg = Registre([_p("Ali Bé", "CNE00001", "CNI001"), _p("Sara Kh", "CNE00002", "CNI002")])
+    reg[1].notes = "végé"
+    reg[1].montant_mad = 12.5
+    autosave(cfg, reg)
+    assert list(load_autosave(cfg).participants()) == list(reg.participants())
+
+
+def test_exporter_tout_csv_txt_json(tmp_path):
+    cfg = Config(dossier_export=str(tmp_path), export_json=True)
+    reg = Registre([
+        _p("Ali Ben", "CNE00001", "CNI001"),
+        _p("Sara Kh", "CNE00002", "CNI002"),
+        _p("Omar Id", "CNE00003", "CNI003"),
+    ])
+    reg[2].statut_frais = "Impayé"
+    reg[2].montant_mad = 0.0
+    reg.supprimer(0)
+
+    csv_path, txt_path, json_path = exporter_tout(cfg, reg)
+
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f)) == [
+            ["nom_complet", "telephone", "age", "CNE", "CNI", "montant_mad", "statut_frais", "notes"],
+            ["Sara Kh", "0600000000", "20", "CNE00002", "CNI002", "20", "Payé", ""],
+            ["Omar Id", "0600000000", "20", "CNE00003", "CNI003", "0", "Impayé", ""],
+        ]
+
+    with open(txt_path, encoding="utf-8") as f:
+        txt = [re.sub(r"\x1b\[[0-9;]*m", "", line) for line in f.read().splitlines()]
+    assert txt[-1] == "Résumé — Participants: 2  Payés: 1  Impayés: 1  Total MAD: 20"
+    assert "Page 1/1 — Total: 2" in txt
+    # le `#` exporté est l’identifiant de session
+    assert any(line.startswith("  1 Sara Kh") for line in txt)
+
+    with open(json_path, encoding="utf-8") as f:
+        assert json.load(f) == [
+            {"nom_complet": "Sara Kh", "telephone": "0600000000", "age": 20, "CNE": "CNE00002",
+             "CNI": "CNI002", "statut_frais": "Payé", "montant_mad": 20.0, "notes": ""},
+            {"nom_complet": "Omar Id", "telephone": "0600000000", "age": 20, "CNE": "CNE00003",
+             "CNI": "CNI003", "statut_frais": "Impayé", "montant_mad": 0.0, "notes": ""},
+        ]
+
+
+def test_validateurs_tel_cne_cni():
+    assert ok_tel("0612345678") and ok_tel("0512345678") and ok_tel("0712345678")
+    assert not ok_tel("061234567")  # trop court
+    assert not ok_tel("06123456789")  # trop long
+    assert not ok_tel("0812345678")
+    assert not ok_tel("0612345678\n")  # fullmatch : pas de saut de ligne final
+    assert not ok_tel(None)
+
+    assert ok_cne("AB123456") and ok_cne("ab12345678cd")
+    assert not ok_cne("AB12345")  # 7 caractères
+    assert not ok_cne("AB12345678CDE")  # 13 caractères
+    assert not ok_cne("AB-23456")
+    assert not ok_cne(None)
+
+    assert ok_cni("AB1234") and ok_cni("AB1234567890")
+    assert not ok_cni("AB123")  # 5 caractères
+    assert not ok_cni("AB12345678901")  # 13 caractères
+    assert not ok_cni(None)